@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
+import bisect
 import csv
 import sys
 import argparse
-from urllib.request import urlopen
+import gzip
+import re
+from urllib.parse import quote
+from urllib.request import Request, urlopen
 
 # Modern Python 3 imports for Qt
 try:
@@ -22,15 +26,38 @@ except ImportError:
 # Note: sgmllib was removed in Python 3, but it's not actually used in this code
 # If HTML parsing is needed, use html.parser or BeautifulSoup instead
 
+# Manufacturer PN on a Mouser product page: the <h1> inside divManufacturerPartNum
+MOUSER_PN_RE = re.compile(r'<div id="divManufacturerPartNum">(?:(?!</div>).)*?<h1>(.*?)</h1>', re.S)
+
+
+def find_mouser_pn(html):
+    """Manufacturer PN from a Mouser product page, None if it isn't there"""
+    m = MOUSER_PN_RE.search(html)
+    if m:
+        return m.group(1).strip()
+    return None
+
 
 class PCBPainter(Widgets.QDialog):
+    keyPressed = QtCore.Signal(str)
+
     def __init__(self, parent):
         super(PCBPainter, self).__init__(parent)
 
+        # Board image with a transparent marker overlay stacked on top of it
         self.imglabel = Widgets.QLabel()
+        self.overlaylabel = Widgets.QLabel()
+
+        imgstack = Widgets.QStackedLayout()
+        imgstack.setStackingMode(Widgets.QStackedLayout.StackAll)
+        imgstack.addWidget(self.imglabel)
+        imgstack.addWidget(self.overlaylabel)
+        imgstack.setCurrentWidget(self.overlaylabel)
+        imgwidget = Widgets.QWidget()
+        imgwidget.setLayout(imgstack)
 
         vb = Widgets.QVBoxLayout()
-        vb.addWidget(self.imglabel)
+        vb.addWidget(imgwidget)
 
         openpb = Widgets.QPushButton("Set PCB Image")
         openpb.clicked.connect(self.set_image)
@@ -48,6 +75,7 @@ class PCBPainter(Widgets.QDialog):
         self.pcbheight.setMaximum(100000)
         self.pcbheight.valueChanged.connect(self.clearfocusdelay)
         self.marker_diameter = 20  # Increased from 5 to 20 for better visibility
+        self._marker_cache = {}  # Rendered marker pixmaps keyed by diameter
 
         buttongrid = Widgets.QHBoxLayout()
         buttongrid.addWidget(openpb)
@@ -69,7 +97,10 @@ class PCBPainter(Widgets.QDialog):
         
         # Store original and display image separately
         self.original_base = None  # Original image for coordinate calculations
+        self.base_pixmap = None    # Original scaled down for display
+        self.overlay = None        # Transparent, display-sized; markers are drawn here
         self.display_scale = 1.0   # Scale factor for display
+        self.redraw_pending = False
 
         self.image_path = ""
 
@@ -88,8 +119,8 @@ class PCBPainter(Widgets.QDialog):
 
 
 
-    def draw_marker(self, x, y, mirror=False):
-        """Draw a placement marker"""
+    def board_scale(self):
+        """Image pixels per board unit as (scale_x, scale_y), or None if the image/board isn't set up"""
 
         boardwidth = self.pcbwidth.value()
         boardheight = self.pcbheight.value()
@@ -102,92 +133,132 @@ class PCBPainter(Widgets.QDialog):
             if img_width == 0 or img_height == 0:
                 error_msg = f"Invalid image dimensions ({img_width}x{img_height}). Please load a valid image first."
                 Widgets.QMessageBox.warning(self, "Invalid Image", error_msg)
-                return
+                return None
                 
             if boardwidth == 0 or boardheight == 0:
                 error_msg = f"Invalid board dimensions ({boardwidth}x{boardheight}). Please set board width and height."
                 Widgets.QMessageBox.warning(self, "Invalid Board Dimensions", error_msg)
-                return
+                return None
                 
             scale_x = float(img_width) / float(boardwidth)
             scale_y = float(img_height) / float(boardheight)
         except ZeroDivisionError:
             Widgets.QMessageBox.warning(self, "Division by Zero", "Division by zero - did you set board height & width in image?")
-            return
+            return None
 
-        x = x * scale_x
-        y = y * scale_y
+        return scale_x, scale_y
+
+    def draw_markers(self, points, mirror=False):
+        """Clear old markers, then draw a placement marker at each board (x, y) in one paint pass"""
+
+        self.clear_markers()
+
+        scale = self.board_scale()
+        if scale is not None:
+            transform = self.board_transform(scale, mirror)
+            marker = self.marker_pixmap()
+
+            # Paint onto the display-sized overlay, so only the markers' own
+            # rectangles get resampled and the board image is never touched
+            painter = QtGui.QPainter()
+            painter.begin(self.overlay)
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, True)
+            painter.scale(self.display_scale, self.display_scale)
+            for x, y in points:
+                self.blit_marker(painter, marker, transform, x, y)
+            painter.end()
+
+        self.schedule_redraw()
+
+    def board_transform(self, scale, mirror):
+        """Board units to image pixels; Y is taken from the other side, and X too when mirrored"""
+        scale_x, scale_y = scale
+        img_width = self.original_base.width()
+        img_height = self.original_base.height()
 
-        #Y taken from wrong side normally
-        y = self.original_base.height() - y
-        
         if mirror:
-            x = self.original_base.width() - x
+            return QtGui.QTransform(-scale_x, 0, 0, -scale_y, img_width, img_height)
+        return QtGui.QTransform(scale_x, 0, 0, -scale_y, 0, img_height)
+
+    def blit_marker(self, painter, marker, transform, x, y):
+        """Map board (x, y) to image pixels and draw the marker there"""
+        pos = transform.map(QtCore.QPointF(x, y))
         
-        print(f"Drawing marker at pixel coordinates: ({x:.1f}, {y:.1f})")
+        print(f"Drawing marker at pixel coordinates: ({pos.x():.1f}, {pos.y():.1f})")
         
         # Convert to integer coordinates for pixel-perfect positioning
-        x_int = int(round(x))
-        y_int = int(round(y))
+        x_int = int(round(pos.x()))
+        y_int = int(round(pos.y()))
         
         # Calculate marker radius for centered drawing
         radius = self.marker_diameter // 2
         
+        painter.drawPixmap(x_int - radius - 2, y_int - radius - 2, marker)
+
+    def marker_pixmap(self):
+        """Marker for the current diameter, rendered once and cached"""
+        diameter = self.marker_diameter
+        if diameter in self._marker_cache:
+            return self._marker_cache[diameter]
+
+        radius = diameter // 2
+        centre = radius + 2
+
+        pixmap = QtGui.QPixmap(diameter + 4, diameter + 4)
+        pixmap.fill(QtCore.Qt.transparent)
+
         painter = QtGui.QPainter()
-        painter.begin(self.base)
+        painter.begin(pixmap)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         
         # Draw shadow/outline (black circle, slightly larger)
         painter.setBrush(QtGui.QBrush(QtCore.Qt.black))
         painter.setPen(QtCore.Qt.NoPen)
         painter.setOpacity(0.7)
-        shadow_rect = QtCore.QRect(x_int - radius - 2, y_int - radius - 2, 
-                                  self.marker_diameter + 4, self.marker_diameter + 4)
-        painter.drawEllipse(shadow_rect)
+        painter.drawEllipse(QtCore.QRect(0, 0, diameter + 4, diameter + 4))
         
         # Draw main marker (bright red circle)
         painter.setBrush(QtGui.QBrush(QtCore.Qt.red))
         painter.setOpacity(1.0)
-        marker_rect = QtCore.QRect(x_int - radius, y_int - radius, 
-                                  self.marker_diameter, self.marker_diameter)
-        painter.drawEllipse(marker_rect)
+        painter.drawEllipse(QtCore.QRect(2, 2, diameter, diameter))
         
         # Draw center crosshair for precise positioning
         painter.setPen(QtGui.QPen(QtCore.Qt.white, 2))
-        painter.drawLine(x_int - radius//2, y_int, x_int + radius//2, y_int)  # Horizontal line
-        painter.drawLine(x_int, y_int - radius//2, x_int, y_int + radius//2)  # Vertical line
+        painter.drawLine(centre - radius//2, centre, centre + radius//2, centre)  # Horizontal line
+        painter.drawLine(centre, centre - radius//2, centre, centre + radius//2)  # Vertical line
         
         painter.end()
 
-    def xy_to_draw(self, x, y, mirror):
-
-        self.reload_base()
+        self._marker_cache[diameter] = pixmap
+        return pixmap
 
-        self.draw_marker(x, y, mirror)
-        
-        self.redraw()
+    def xy_to_draw(self, x, y, mirror):
+        self.draw_markers([(x, y)], mirror)
     
 
     def reload_base(self):
         # Load original image for coordinate calculations
-        self.original_base = QtGui.QImage(self.image_path)
+        reader = QtGui.QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+        self.original_base = reader.read()
         
         # Check if image loaded successfully
         if self.original_base.isNull() or self.original_base.width() == 0 or self.original_base.height() == 0:
-            error_msg = f"Failed to load image: {self.image_path}\n\nPlease check:\n1. File exists\n2. File path is correct\n3. Image format is supported (PNG, JPG, etc.)"
+            error_msg = f"Failed to load image: {self.image_path}\n({reader.errorString()})\n\nPlease check:\n1. File exists\n2. File path is correct\n3. Image format is supported (PNG, JPG, etc.)"
             Widgets.QMessageBox.critical(self, "Image Load Error", error_msg)
             # Create a dummy image to prevent crashes
             self.original_base = QtGui.QImage(100, 100, QtGui.QImage.Format_RGB32)
             self.original_base.fill(QtCore.Qt.lightGray)
             print(f"ERROR: Could not load image from: {self.image_path}")
-            return
-        
-        # Convert to RGB32 format if it's an indexed format to support QPainter operations
-        if self.original_base.format() == QtGui.QImage.Format_Indexed8 or self.original_base.format() == QtGui.QImage.Format_Mono:
-            self.original_base = self.original_base.convertToFormat(QtGui.QImage.Format_RGB32)
-        
-        # Create working copy for drawing markers
-        self.base = self.original_base.copy()
+        else:
+            # Convert indexed/mono/etc. to a 32-bit format in place so QPainter stays on its fast path
+            if self.original_base.format() not in (QtGui.QImage.Format_RGB32, QtGui.QImage.Format_ARGB32,
+                                                   QtGui.QImage.Format_ARGB32_Premultiplied):
+                if self.original_base.hasAlphaChannel():
+                    self.original_base.convertTo(QtGui.QImage.Format_ARGB32_Premultiplied)
+                else:
+                    self.original_base.convertTo(QtGui.QImage.Format_RGB32)
+            print(f"Successfully loaded image: {self.image_path} ({self.original_base.width()}x{self.original_base.height()})")
         
         # Calculate display scale to fit within reasonable window size
         max_display_width = 800
@@ -205,18 +276,36 @@ class PCBPainter(Widgets.QDialog):
             # Fallback if dimensions are invalid
             self.display_scale = 1.0
             print(f"WARNING: Invalid image dimensions ({img_width}x{img_height}), using scale 1.0")
-        
-        print(f"Successfully loaded image: {self.image_path} ({self.original_base.width()}x{self.original_base.height()})")
 
-    def redraw(self):
-        # Scale image for display while keeping original for coordinates
+        # Scale for display once per load; the board label keeps this until the next load
         if self.display_scale < 1.0:
-            display_width = int(self.base.width() * self.display_scale)
-            display_height = int(self.base.height() * self.display_scale)
-            scaled_image = self.base.scaled(display_width, display_height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            self.imglabel.setPixmap(QtGui.QPixmap.fromImage(scaled_image))
+            display_width = int(img_width * self.display_scale)
+            display_height = int(img_height * self.display_scale)
+            scaled_base = self.original_base.scaled(display_width, display_height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
         else:
-            self.imglabel.setPixmap(QtGui.QPixmap.fromImage(self.base))
+            scaled_base = self.original_base
+        self.base_pixmap = QtGui.QPixmap.fromImage(scaled_base)
+        self.imglabel.setPixmap(self.base_pixmap)
+
+        self.overlay = QtGui.QPixmap(self.base_pixmap.size())
+        self.clear_markers()
+
+    def clear_markers(self):
+        """Remove all markers, leaving the bare board"""
+        if self.overlay is None:
+            self.reload_base()
+            return
+        self.overlay.fill(QtCore.Qt.transparent)
+
+    def schedule_redraw(self):
+        """Redraw once the current event is handled, however many times this gets called before then"""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            QtCore.QTimer.singleShot(0, self.redraw)
+
+    def redraw(self):
+        self.redraw_pending = False
+        self.overlaylabel.setPixmap(self.overlay)
     
     def configure_pcb_dimensions(self, height, width):
         self.pcbwidth.setValue(width)
@@ -234,7 +323,7 @@ class PCBPainter(Widgets.QDialog):
                 Widgets.QMessageBox.critical(self, "File Not Found", error_msg)
                 return
             self.reload_base()
-            self.redraw()
+            self.schedule_redraw()
 
     def set_image(self):
         filename, filter = Widgets.QFileDialog.getOpenFileName(parent=self, caption='Select PCB Image', dir='.',
@@ -250,6 +339,11 @@ class PCBPainter(Widgets.QDialog):
         self.pcbwidth.clearFocus()
         self.pcbheight.clearFocus()
 
+    def keyPressEvent(self, event):
+        """Hand keystrokes (i.e. the scanner) to the main window rather than the dialog"""
+        self.keyPressed.emit(event.text())
+        event.accept()
+
 
 class MeatBagCSVSettings(object):
     def __init__(self):
@@ -301,6 +395,101 @@ class MeatBagCSVSettingsKicadMultiLayer(MeatBagCSVSettingsKicadSingleLayer):
         self.col_layer = 6
 
 
+def find_matches(entries, text, min_len):
+    """Indices of entries containing text, or longer than min_len and contained in text"""
+    return [i for i, entry in enumerate(entries)
+            if (len(entry) > min_len and entry in text) or text in entry]
+
+
+def sorted_contains(values, x):
+    """Membership test on an ascending list"""
+    i = bisect.bisect_left(values, x)
+    return i < len(values) and values[i] == x
+
+
+class MatchIndex(object):
+    """ find_matches() over a fixed column, with the entries joined into one buffer
+        so looking for text inside the entries is a C-level str.find() per hit """
+    SEP = "\0"
+
+    def __init__(self, entries, min_len):
+        self.entries = entries
+        self.min_len = min_len
+        self.buffer = self.SEP.join(entries)
+
+        # Start offset of each entry within the buffer
+        self.offsets = []
+        pos = 0
+        for entry in entries:
+            self.offsets.append(pos)
+            pos += len(entry) + 1
+
+        # Only these can match the other way round (entry inside text)
+        self.long_entries = [(i, entry) for i, entry in enumerate(entries) if len(entry) > min_len]
+
+    def find(self, text):
+        if not text or self.SEP in text:
+            return find_matches(self.entries, text, self.min_len)
+
+        hits = set(i for i, entry in self.long_entries if entry in text)
+
+        # text has no separator, so each hit lies inside a single entry
+        pos = self.buffer.find(text)
+        while pos >= 0:
+            i = bisect.bisect_right(self.offsets, pos) - 1
+            hits.add(i)
+            if i + 1 >= len(self.offsets):
+                break
+            pos = self.buffer.find(text, self.offsets[i + 1])
+
+        return sorted(hits)
+
+
+def fetch_url(url, timeout=5):
+    """Fetch a web page (gzip-compressed if the server agrees) and return it as text"""
+    request = Request(url, headers={'Accept-Encoding': 'gzip', 'User-Agent': 'Mozilla/5.0 (MeatBagPnP)'})
+    with urlopen(request, timeout=timeout) as sock:
+        data = sock.read()
+        if sock.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        charset = sock.headers.get_content_charset() or 'utf-8'
+    return data.decode(charset, errors='replace')
+
+
+class FetchJob(QtCore.QRunnable):
+    """ thread pool job for UrlFetcher """
+    def __init__(self, fetcher, url, callback):
+        super(FetchJob, self).__init__()
+        self.fetcher = fetcher
+        self.url = url
+        self.callback = callback
+
+    def run(self):
+        # Any failure (socket, HTTP protocol, unknown charset...) still has to reach the callback,
+        # which falls back to other lookups
+        try:
+            html = fetch_url(self.url)
+        except Exception as ex:
+            print(f"Lookup of {self.url} failed: {ex}")
+            html = None
+        self.fetcher.done.emit(self.callback, html)
+
+
+class UrlFetcher(QtCore.QObject):
+    """ fetches pages off the GUI thread; callback(html) runs back on the GUI thread, html is None on failure """
+    done = QtCore.Signal(object, object)
+
+    def __init__(self, parent=None):
+        super(UrlFetcher, self).__init__(parent)
+        self.done.connect(self.deliver)
+
+    def fetch(self, url, callback):
+        QtCore.QThreadPool.globalInstance().start(FetchJob(self, url, callback))
+
+    def deliver(self, callback, html):
+        callback(html)
+
+
 class KeyAction(object):
     """ action associated with a key """
     def __init__(self, key, callback):
@@ -317,15 +506,144 @@ class KeyAction(object):
         return self.cb()
 
 
+class BomModel(QtCore.QAbstractTableModel):
+    """ PnP rows for the selected side, with a 'placed' checkbox in the last column """
+    placedChanged = QtCore.Signal(int, bool)
+    cellEdited = QtCore.Signal(int, int)
+
+    def __init__(self, parent=None):
+        super(BomModel, self).__init__(parent)
+        self._rows = []
+        self._is_top = []
+        self._placed = bytearray()  # One byte per row, non-zero once placed
+        self._numCols = 0
+        self._row_start = 0
+
+        # Background keyed by (is_top, placed); unknown layers are grey
+        self._colours = {
+            (True, False): QtGui.QColor(255, 0, 0, 120),
+            (True, True): QtGui.QColor(255, 0, 0, 5),
+            (False, False): QtGui.QColor(0, 0, 255, 120),
+            (False, True): QtGui.QColor(0, 0, 255, 5),
+        }
+        self._unknown = QtGui.QColor(QtCore.Qt.lightGray)
+
+    def set_rows(self, rows, is_top, row_start):
+        """Replace all rows; is_top holds True/False/None (unknown) per row"""
+        self.beginResetModel()
+        self._rows = rows
+        self._is_top = is_top
+        self._placed = bytearray(len(rows))
+        self._numCols = len(rows[0]) + 1 if rows else 0
+        self._row_start = row_start
+        self.endResetModel()
+
+    def rows(self):
+        return self._rows
+
+    def text(self, row, col):
+        """Cell text, '???' for cells missing from a short CSV row"""
+        if col >= self._numCols - 1:
+            return ""
+        try:
+            return self._rows[row][col]
+        except IndexError:
+            return "???"
+
+    def is_top(self, row):
+        return self._is_top[row]
+
+    def is_placed(self, row):
+        return self._placed[row] != 0
+
+    def set_is_top(self, row, is_top):
+        self._is_top[row] = is_top
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self._numCols - 1),
+                              [QtCore.Qt.BackgroundRole])
+
+    def set_placed(self, row, placed=True):
+        state = QtCore.Qt.Checked if placed else QtCore.Qt.Unchecked
+        self.setData(self.index(row, self._numCols - 1), state, QtCore.Qt.CheckStateRole)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._numCols
+
+    def flags(self, index):
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == self._numCols - 1:
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        else:
+            # Lets the user fix a bad coordinate or PN by double-clicking it
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = index.row()
+        c = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if c == self._numCols - 1:
+                return None
+            return self.text(r, c)
+        elif role == QtCore.Qt.EditRole:
+            if c == self._numCols - 1:
+                return None
+            row = self._rows[r]
+            return row[c] if c < len(row) else ""
+        elif role == QtCore.Qt.CheckStateRole:
+            if c == self._numCols - 1:
+                return QtCore.Qt.Checked if self._placed[r] else QtCore.Qt.Unchecked
+        elif role == QtCore.Qt.BackgroundRole:
+            if r < self._row_start:
+                return None
+            is_top = self._is_top[r]
+            if is_top is None:
+                return self._unknown
+            return self._colours[(is_top, self._placed[r] != 0)]
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role == QtCore.Qt.EditRole and index.column() < self._numCols - 1:
+            return self.set_text(index, value)
+        if role != QtCore.Qt.CheckStateRole or index.column() != self._numCols - 1:
+            return False
+        r = index.row()
+        placed = QtCore.Qt.CheckState(value) == QtCore.Qt.Checked
+        self._placed[r] = placed
+        # The row's colour follows its check state, so only that row needs repainting
+        self.dataChanged.emit(self.index(r, 0), self.index(r, self._numCols - 1),
+                              [QtCore.Qt.CheckStateRole, QtCore.Qt.BackgroundRole])
+        self.placedChanged.emit(r, placed)
+        return True
+
+    def set_text(self, index, value):
+        r = index.row()
+        c = index.column()
+        row = self._rows[r]
+        if c >= len(row):
+            # Short CSV row, pad it out so the edited cell exists
+            row.extend([""] * (c + 1 - len(row)))
+        row[c] = str(value)
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        self.cellEdited.emit(r, c)
+        return True
+
+
 class MeatBagWindow(Widgets.QMainWindow):
     
     def __init__(self, csvSettings, parsedArgs):
         super(MeatBagWindow, self).__init__()
         self.setWindowTitle("Meat Bag Pick-n-Place v0.0000000003")
 
-        self.efilter = filterObj(self)
-        self.installEventFilter(self.efilter)
-
         self.initLayout()
         self.initMenus()
         if csvSettings:
@@ -339,7 +657,11 @@ class MeatBagWindow(Widgets.QMainWindow):
         self.webView = WebView()
         self.webView.loadFinished.connect(self.lookupdone)
 
+        self.fetcher = UrlFetcher(self)
+
         self.last_keys = ""
+        # Last text handed to process_new_scan, cleared whenever the matches are replaced some other way
+        self.last_scan = ""
         self.timerScan = QtCore.QTimer()
         self.timerScan.setSingleShot(True)
         self.timerScan.timeout.connect(self.timesUp)
@@ -353,6 +675,7 @@ class MeatBagWindow(Widgets.QMainWindow):
 
         self.cur_placement = None
         self.drawing_all_same_value = False
+        self.clear_matches()
         if parsedArgs is None:
             return
         # handle cmd line args
@@ -374,10 +697,15 @@ class MeatBagWindow(Widgets.QMainWindow):
         mainLayout = Widgets.QVBoxLayout()
 
         ###Main parts table
-        self.table = Widgets.QTableWidget()
+        self.bom = BomModel(self)
+        self.table = Widgets.QTableView()
+        self.table.setModel(self.bom)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.installEventFilter(self.efilter)
-        self.table.cellClicked.connect(self.table_cellClicked)
+        # Keep keyboard focus off the table so scanner keystrokes reach the window
+        self.table.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.table.clicked.connect(self.table_clicked)
+        self.bom.placedChanged.connect(self.placement_changed)
+        self.bom.cellEdited.connect(self.cell_edited)
 
         ###Build Configuration
         gbBuildSetup = Widgets.QGroupBox()
@@ -389,7 +717,7 @@ class MeatBagWindow(Widgets.QMainWindow):
         cbSide.addItem("Top")
         cbSide.addItem("Bottom")
         cbSide.activated.connect(self.sideSelectionChanged)
-        cbSide.installEventFilter(self.efilter)
+        cbSide.setFocusPolicy(QtCore.Qt.NoFocus)
         
         buildLayout.addWidget(cbSide, 0, 0)
         gbBuildSetup.setLayout(buildLayout)
@@ -448,7 +776,7 @@ class MeatBagWindow(Widgets.QMainWindow):
 
         self.pcbpainter = PCBPainter(window)
         self.pcbpainter.show()
-        self.pcbpainter.installEventFilter(self.efilter)
+        self.pcbpainter.keyPressed.connect(self.key_pressed)
         
         mainLayout.addWidget(self.table)
         mainLayout.addWidget(gbBuildSetup)
@@ -468,17 +796,40 @@ class MeatBagWindow(Widgets.QMainWindow):
 
     def isTopLayer(self, row):
         """Check if a given row (0-based index) is top-side or bottom-side part"""
-        if self.csv_settings.col_layer < 0:
+        is_top = self.bom.is_top(row)
+        if is_top is None:
+            raise ValueError(f"Unknown layer for row {row} in col {self.csv_settings.col_layer}")
+        return is_top
+
+    def layer_of_row(self, row, col_layer):
+        """Parse the layer column of a raw CSV row: True for top, False for bottom, None if unknown"""
+        if col_layer < 0:
             return True
+        if len(row) <= col_layer:
+            return None
 
-        tb = self.table.item(row, self.csv_settings.col_layer).text()
+        tb = row[col_layer].lower()
 
-        if tb.lower().startswith("top"):
+        if tb.startswith("top"):
             return True
-        elif tb.lower().startswith("bot"):
+        elif tb.startswith("bot"):
             return False
         else:
-            raise ValueError(f"Unknown layer for row {row}: '{tb.lower()}' in col {self.csv_settings.col_layer}")
+            return None
+
+    def position(self, row):
+        """Board (x, y) of a row (0-based index)"""
+        xy = self.xy_list[row]
+        if xy is None:
+            raise ValueError(f"No valid X/Y for row {row} in cols {self.csv_settings.col_x}/{self.csv_settings.col_y}")
+        return xy
+
+    def parse_xy(self, row, col_x, col_y):
+        """Parse the X/Y columns of a raw CSV row, None if they aren't numbers"""
+        try:
+            return (float(row[col_x]), float(row[col_y]))
+        except (IndexError, ValueError):
+            return None
 
     def sideSelectionChanged(self, indx):
         """User changed build side"""
@@ -490,11 +841,10 @@ class MeatBagWindow(Widgets.QMainWindow):
         """Directly highlight the component at the specified table row"""
         try:
             # Get the component reference (designator)
-            ref = self.table.item(row, self.csv_settings.col_des).text()
+            ref = self.des_list[row]
             
             # Get coordinates
-            x = float(self.table.item(row, self.csv_settings.col_x).text())
-            y = float(self.table.item(row, self.csv_settings.col_y).text())
+            x, y = self.position(row)
             
             # Determine if it's a top or bottom layer component
             is_bottom = not self.isTopLayer(row)
@@ -510,9 +860,10 @@ class MeatBagWindow(Widgets.QMainWindow):
         except (ValueError, AttributeError) as e:
             print(f"Error highlighting component at row {row}: {e}")
 
-    def table_cellClicked(self, row, col):
+    def table_clicked(self, index):
         """User click on a cell"""
-        
+        row = index.row()
+
         # Skip header rows
         if row < self.csv_settings.row_start:
             return
@@ -521,9 +872,11 @@ class MeatBagWindow(Widgets.QMainWindow):
         self.highlight_component_at_row(row)
         
         # Also try the original part number matching for compatibility
-        pn = self.table.item(row, self.csv_settings.col_pn).text()
-        com = self.table.item(row, self.csv_settings.col_com).text()
-        
+        pn = self.pdb[row]
+        com = self.pdc[row]
+
+        # Matches no longer come from the scan line, so the same scan has to look up again
+        self.last_scan = ""
         if pn is None or pn == "":
             #raise ValueError("Null PN for row - matching with Comment")
             self.process_new_com(com)
@@ -545,52 +898,55 @@ class MeatBagWindow(Widgets.QMainWindow):
         """Group components by their values for intuitive placement workflow"""
         if not ppdata or len(ppdata) == 0:
             return ppdata
-            
-        # Keep header row separate
+
+        col_com = self.csv_settings.col_com
+        col_layer = self.csv_settings.col_layer
+        col_des = self.csv_settings.col_des
+
+        def group_key(row):
+            # Groups are ordered by the "value_layer" string (value like "0.1uF", "10k"),
+            # components within a group by designator
+            if col_layer < 0:
+                layer = "top"
+            else:
+                layer = row[col_layer] if len(row) > col_layer else ""
+            des = row[col_des] if len(row) > col_des else ""
+            return (f"{row[col_com]}_{layer}", des)
+
+        # Keep header row separate, then one sort puts each value/layer group together.
+        # Keys are built once per row; the file position keeps equal keys in file order.
         header_row = ppdata[0]
-        data_rows = ppdata[1:] if len(ppdata) > 1 else []
-        
-        # Group components by value (column 1 in KiCad format)
-        value_groups = {}
-        
-        for row in data_rows:
-            if len(row) <= self.csv_settings.col_com:
-                continue
-                
-            value = row[self.csv_settings.col_com]  # Component value (like "0.1uF", "10k")
-            layer = row[self.csv_settings.col_layer] if self.csv_settings.col_layer >= 0 else "top"
-            
-            # Create a key combining value and layer for better organization
-            key = f"{value}_{layer}"
-            
-            if key not in value_groups:
-                value_groups[key] = []
-            value_groups[key].append(row)
-        
-        # Sort groups by value name for consistent ordering
-        sorted_groups = sorted(value_groups.items())
-        
-        # Rebuild the data with header first, then grouped components
+        keyed = [(group_key(row), i, row) for i, row in enumerate(ppdata[1:]) if len(row) > col_com]
+        keyed.sort()
+
         grouped_data = [header_row]
-        
-        for group_key, components in sorted_groups:
-            # Sort components within each group by designator
-            components.sort(key=lambda x: x[self.csv_settings.col_des] if len(x) > self.csv_settings.col_des else "")
-            grouped_data.extend(components)
-        
-        print(f"Grouped {len(data_rows)} components into {len(value_groups)} groups")
+        num_groups = 0
+        last_group = None
+        for (group, _), _, row in keyed:
+            if group != last_group:
+                num_groups += 1
+                last_group = group
+            grouped_data.append(row)
+
+        print(f"Grouped {len(keyed)} components into {num_groups} groups")
         return grouped_data
 
     def parseCSVFile(self, filename):
-        ppdata = []
-        
-        with open(filename, "r") as csvfile:
-            ppfile = csv.reader(csvfile, delimiter=',', quotechar='"')
-            for row in ppfile:
+        # Tokenize the whole file in one go, then split off short lines
+        with open(filename, "r", newline='') as csvfile:
+            rows = list(csv.reader(csvfile, delimiter=',', quotechar='"'))
+
+        ppdata = [row for row in rows if len(row) >= 4]
+        if len(ppdata) != len(rows):
+            for row in rows:
                 if len(row) < 4:
                     print(f"Skipped line: {' '.join(row)}")
-                else:
-                    ppdata.append(row)
+
+        # Values and PNs repeat a lot (e.g. 50 x "100n"), so share one string object for each
+        for col in (self.csv_settings.col_pn, self.csv_settings.col_com):
+            for row in ppdata:
+                if len(row) > col:
+                    row[col] = sys.intern(row[col])
 
         # Store all component data for filtering
         self.all_components_data = self.group_components_by_value(ppdata)
@@ -604,83 +960,72 @@ class MeatBagWindow(Widgets.QMainWindow):
             return
             
         # Filter components based on selected side
-        filtered_data = []
         header_row = self.all_components_data[0]  # Always include header
-        filtered_data.append(header_row)
-        
+        data_rows = self.all_components_data[1:]
+
         # Determine which side to show (0 = top, 1 = bottom)
-        target_side = "top" if self.build_side == 0 else "bottom"
-        
-        for row in self.all_components_data[1:]:  # Skip header row
-            if len(row) > self.csv_settings.col_layer and self.csv_settings.col_layer >= 0:
-                layer = row[self.csv_settings.col_layer].lower()
-                if layer.startswith(target_side[:3]):  # "top" or "bot"
-                    filtered_data.append(row)
-            elif self.csv_settings.col_layer < 0:  # No layer column, assume top
-                if target_side == "top":
-                    filtered_data.append(row)
-        
-        # Update table with filtered data
-        self.table.clear()
-        numRows = len(filtered_data)
-        numCols = len(header_row) + 1
-        self.table.setRowCount(numRows)
-        self.table.setColumnCount(numCols)
+        prefix = "top" if self.build_side == 0 else "bot"
+        col_layer = self.csv_settings.col_layer
+
+        if col_layer >= 0:
+            filtered_data = [header_row] + [row for row in data_rows
+                                            if len(row) > col_layer and row[col_layer][:3].lower() == prefix]
+        elif prefix == "top":  # No layer column, assume top
+            filtered_data = [header_row] + data_rows
+        else:
+            filtered_data = [header_row]
         
-        for r in range(0, numRows):
-            for c in range(0, numCols - 1):
-                try:
-                    self.table.setItem(r, c, Widgets.QTableWidgetItem(filtered_data[r][c]))
-                except IndexError:
-                    self.table.setItem(r, c, Widgets.QTableWidgetItem("???"))
-
-            checkitem = Widgets.QTableWidgetItem()
-            checkitem.setCheckState(QtCore.Qt.Unchecked)
-            self.table.setItem(r, numCols-1, checkitem)
-
-        # Rebuild local database for filtered data
-        self.pdb = []
-        for r in range(0, numRows):
-            if r < len(filtered_data) and len(filtered_data[r]) > self.csv_settings.col_pn:
-                self.pdb.append(filtered_data[r][self.csv_settings.col_pn])
-            else:
-                self.pdb.append("")
+        self.build_lookups(filtered_data)
 
-        self.pdc = []
-        for r in range(0, numRows):
-            if r < len(filtered_data) and len(filtered_data[r]) > self.csv_settings.col_com:
-                self.pdc.append(filtered_data[r][self.csv_settings.col_com])
-            else:
-                self.pdc.append("")
+        # Update table with filtered data
+        is_top = [self.layer_of_row(row, col_layer) for row in filtered_data]
+        self.bom.set_rows(filtered_data, is_top, self.csv_settings.row_start)
+        # Old matches are row numbers into the previous table
+        self.cur_placement = None
+        self.clear_matches()
         
         side_name = "TOP" if self.build_side == 0 else "BOTTOM"
-        component_count = numRows - 1  # Subtract header row
+        component_count = len(filtered_data) - 1  # Subtract header row
         print(f"Showing {component_count} {side_name} side components")
-        
-        self.recolourTable()
-
-    def recolourTable(self):
-        """Redo the table colour stuff"""
-        rowcnt = self.table.rowCount()
-        colcnt = self.table.columnCount()
-
-        for r in range(self.csv_settings.row_start, rowcnt):
-            try:
-                placed = self.table.item(r, colcnt-1).checkState() == QtCore.Qt.Checked
-                if placed:
-                    alpha = 5
-                else:
-                    alpha = 120
-                if self.isTopLayer(r):
-                    bgc = QtGui.QColor(255, 0, 0, alpha)
-                else:
-                    bgc = QtGui.QColor(0, 0, 255, alpha)
-            except ValueError:
-                bgc = QtCore.Qt.lightGray
 
-            for c in range(0, colcnt):
+    def build_lookups(self, rows):
+        """Rebuild local database for the rows shown in the table"""
+        col_pn = self.csv_settings.col_pn
+        col_com = self.csv_settings.col_com
+        col_des = self.csv_settings.col_des
+        col_x = self.csv_settings.col_x
+        col_y = self.csv_settings.col_y
+        self.pdb = [row[col_pn] if len(row) > col_pn else "" for row in rows]
+        self.pdc = [row[col_com] if len(row) > col_com else "" for row in rows]
+        self.des_list = [row[col_des] if len(row) > col_des else "" for row in rows]
+        self.xy_list = [self.parse_xy(row, col_x, col_y) for row in rows]
+
+        # Rows sharing each PN, for showing all parts of the current value at once
+        self.pn_rows = {}
+        for r, pn in enumerate(self.pdb):
+            self.pn_rows.setdefault(pn, []).append(r)
+        self.pdb_index = MatchIndex(self.pdb, 4)
+        self.pdc_index = MatchIndex(self.pdc, 3)
+        # The last scan was looked up in the old data, so scanning it again has to redo it
+        self.last_scan = ""
+
+    def cell_edited(self, row, col):
+        """User fixed a cell in the table, refresh whatever was built from it"""
+        settings = self.csv_settings
+        rows = self.bom.rows()
+        if col == settings.col_layer:
+            self.bom.set_is_top(row, self.layer_of_row(rows[row], settings.col_layer))
+        elif col in (settings.col_pn, settings.col_com, settings.col_des, settings.col_x, settings.col_y):
+            self.build_lookups(rows)
+        else:
+            return
+
+        if row == self.cur_placement:
+            self.update_placement()
 
-                self.table.item(r, c).setBackground(bgc)
+    def keyPressEvent(self, event):
+        self.key_pressed(event.text())
+        event.accept()
 
     def key_pressed(self, key):
         self.last_keys += key
@@ -696,21 +1041,21 @@ class MeatBagWindow(Widgets.QMainWindow):
             #User is moving between items
             last_place = self.cur_placement
 
-            try:
-                self.table.item(last_place, self.table.columnCount()-1).setCheckState(QtCore.Qt.Checked)
-            except TypeError:
-                pass
+            if last_place is not None:
+                self.bom.set_placed(last_place)
 
             self.find_next_placement()
-            self.recolourTable()
             return
 
 
         #Remove line endings etc
         scan = scan.strip()
 
-        #This triggers scan stuff
+        #Scan is already complete, so show it without going through the scan line debounce
+        self.scanLine.blockSignals(True)
         self.scanLine.setPlainText(scan)
+        self.scanLine.blockSignals(False)
+        self.process_scanline(scan)
 
     def process_keystroke(self, txt):
         action_map = [
@@ -754,24 +1099,25 @@ class MeatBagWindow(Widgets.QMainWindow):
                 pn = pn_start.split('K1K5')[0]
                 self.process_new_pn(pn)
             else:
-                internal_pn = scan[0:7]
-                qty = int(scan[10:16])
-
-                print("Old-style barcode, attempting lookup")
-                sock = urlopen(
-                    f'https://www.digikey.com/product-detail/en/keystone-electronics/4245C/36-4245C-ND/{internal_pn}')
-                data = sock.read().decode('utf-8')
-                raise NotImplementedError("Old-style barcode not implemented")
-
-                #TODO: If you need to fix this, hack around following code to get actual PN not supplier one
-                # data = data.split(" ")
-                digikey_pn = data.split('content="sku:')[1].split("-ND")[0] + "-ND"
-                # print(f"{digikey_pn}: {qty}")
+                # Old-style barcodes only carry DigiKey's internal PN, they aren't supported
+                print("Old-style barcode, not supported")
         else:
             # MOUSER???
-            print("Maybe Mouser? Trying lookup - WAITING FOR WEBPAGE NOW")
-            #Use webview as need JS
-            self.webView.load(QtCore.QUrl(f'https://ca.mouser.com/search/ProductDetail.aspx?R={scan}'))
+            print("Maybe Mouser? Trying lookup")
+            url = f'https://ca.mouser.com/search/ProductDetail.aspx?R={quote(scan, safe="")}'
+            self.fetcher.fetch(url, lambda html: self.mouser_lookupdone(url, html))
+
+    def mouser_lookupdone(self, url, html):
+        """Called with the Mouser page fetched without JS (None if the fetch failed)"""
+        pn = find_mouser_pn(html) if html is not None else None
+        if pn:
+            print(f"Found PN: {pn}")
+            self.process_new_pn(pn)
+            return
+
+        print("PN not in plain page - WAITING FOR WEBPAGE NOW")
+        #Use webview as need JS
+        self.webView.load(QtCore.QUrl(url))
 
     def lookupdone(self, _=None):
         """Called when website loaded"""
@@ -779,12 +1125,11 @@ class MeatBagWindow(Widgets.QMainWindow):
         # This needs to be rewritten using the async toHtml() method
         def handle_html(html):
             #Decode website type - try mouser first
-            try:
-                pn = html.split('<div id="divManufacturerPartNum">')[1].split("</div>")[0]
-                pn = pn.split('<h1>')[1].split('</h1>')[0]
+            pn = find_mouser_pn(html)
+            if pn:
                 print(f"Found PN: {pn}")
                 self.process_new_pn(pn)
-            except IndexError:
+            else:
                 print("Failed to find PN in returned site.")
         
         # Use the async method for getting HTML content
@@ -792,64 +1137,51 @@ class MeatBagWindow(Widgets.QMainWindow):
 
     def process_new_com(self, com, update_placement=True):
         """Given a Comment, find all likely matches"""
-        matchlist = []
-
-        #Simple matching algorithm
-        
-        for i in range(0, len(self.pdc)):
-            #print("checking")
-            if (len(self.pdc[i]) > 3 and self.pdc[i] in com) or com in self.pdc[i]:
-                matchlist.append(i)
-        #print(matchlist)
-
-        self.topDesList = []
-        self.botDesList = []
-        topDesStr = ""
-        botDesStr = ""
-
-        for r in matchlist:
-            if self.isTopLayer(r):
-                self.topDesList.append(r)
-                topDesStr += self.table.item(r, self.csv_settings.col_des).text() + ", "
-            else:
-                self.botDesList.append(r)
-                botDesStr += self.table.item(r, self.csv_settings.col_des).text() + ", "
-
-        self.topDes.setText(topDesStr)
-        self.botDes.setText(botDesStr)
-
-        if update_placement:
-            self.find_next_placement()   
-
+        self.show_matches(self.pdc_index.find(com), update_placement)
 
     def process_new_pn(self, pn, update_placement=True):
         """Given a manufacturer's PN, find all likely matches"""
-        matchlist = []
-
-        #Simple matching algorithm
-        for i in range(0, len(self.pdb)):
-            if (len(self.pdb[i]) > 4 and self.pdb[i] in pn) or pn in self.pdb[i]:
-                matchlist.append(i)
+        self.show_matches(self.pdb_index.find(pn), update_placement)
 
+    def show_matches(self, matchlist, update_placement=True):
+        """Split matched rows into top/bottom lists and display their designators"""
         self.topDesList = []
         self.botDesList = []
-        topDesStr = ""
-        botDesStr = ""
 
         for r in matchlist:
             if self.isTopLayer(r):
                 self.topDesList.append(r)
-                topDesStr += self.table.item(r, self.csv_settings.col_des).text() + ", "
             else:
                 self.botDesList.append(r)
-                botDesStr += self.table.item(r, self.csv_settings.col_des).text() + ", "
 
-        self.topDes.setText(topDesStr)
-        self.botDes.setText(botDesStr)
+        self.topDes.setText("".join(self.des_list[r] + ", " for r in self.topDesList))
+        self.botDes.setText("".join(self.des_list[r] + ", " for r in self.botDesList))
+
+        # Unplaced matches, kept sorted so the next placement is always the first one
+        is_placed = self.bom.is_placed
+        self.pendingTop = [r for r in self.topDesList if not is_placed(r)]
+        self.pendingBot = [r for r in self.botDesList if not is_placed(r)]
 
         if update_placement:
             self.find_next_placement()
 
+    def clear_matches(self):
+        self.topDesList = []
+        self.botDesList = []
+        self.pendingTop = []
+        self.pendingBot = []
+
+    def placement_changed(self, row, placed):
+        """Keep the pending lists in step with a row being (un)checked"""
+        for parts, pending in ((self.topDesList, self.pendingTop), (self.botDesList, self.pendingBot)):
+            i = bisect.bisect_left(pending, row)
+            in_pending = i < len(pending) and pending[i] == row
+            if placed:
+                if in_pending:
+                    del pending[i]
+            elif not in_pending and sorted_contains(parts, row):
+                pending.insert(i, row)
+
     def toggle_draw_all_of_current_value(self):
         #print("draw_all_of_current_value")
         if self.cur_placement is None or not self.cur_placement:
@@ -857,51 +1189,44 @@ class MeatBagWindow(Widgets.QMainWindow):
             return False
         
         if self.drawing_all_same_value:
-            self.drawing_all_same_value = False
+            # update_placement() clears the flag and redraws just the current part
             self.update_placement()
-            return
+            return False
 
         if self.build_side == 0:
             parts = self.topDesList
         else:
             parts = self.botDesList
-        cur_part_num_txt = self.table.item(self.cur_placement, self.csv_settings.col_pn).text()
-        matchingPartsPos = []
-        for p in parts:
-            if p != self.cur_placement and  self.table.item(p, self.csv_settings.col_pn).text() == cur_part_num_txt:
-                matchingPartsPos.append([float(self.table.item(p, self.csv_settings.col_x).text()), 
-                                       float(self.table.item(p, self.csv_settings.col_y).text())])
-
-        if not len(matchingPartsPos):
+        cur_part_num_txt = self.pdb[self.cur_placement]
+        matchingRows = [p for p in self.pn_rows[cur_part_num_txt]
+                        if p != self.cur_placement and sorted_contains(parts, p)]
+
+        if not len(matchingRows):
             print("No matching parts")
             return False
-        self.update_placement()
-        for pos in matchingPartsPos:
-            self.pcbpainter.draw_marker(pos[0], pos[1])
 
+        # Current part first, then every match, all in one paint pass
+        points = [self.position(p) for p in [self.cur_placement] + matchingRows]
+        self.pcbpainter.draw_markers(points, not self.isTopLayer(self.cur_placement))
         
         self.drawing_all_same_value = True
-        self.pcbpainter.redraw()
         return False
         
 
     def find_next_placement(self):
         """Check the list for unplaced part on active layer"""
-        self.cur_placement = None
-
         if self.build_side == 0:
-            parts = self.topDesList
+            pending = self.pendingTop
         else:
-            parts = self.botDesList
-
-        last_col = self.table.columnCount() - 1
+            pending = self.pendingBot
 
-        for p in parts:
-            if self.table.item(p, last_col).checkState() == QtCore.Qt.Unchecked:
-                #Next placement is 'p'
-                self.cur_placement = p
-                self.table.scrollToItem(self.table.item(p, 0))
-                break
+        #Next placement is the first unplaced part
+        self.cur_placement = pending[0] if pending else None
+        if self.cur_placement is not None:
+            index = self.bom.index(self.cur_placement, 0)
+            # Working through neighbouring rows usually leaves the next one on screen already
+            if not self.table.viewport().rect().contains(self.table.visualRect(index)):
+                self.table.scrollTo(index, Widgets.QAbstractItemView.PositionAtCenter)
 
         self.update_placement()
 
@@ -909,11 +1234,10 @@ class MeatBagWindow(Widgets.QMainWindow):
         """Using variable self.cur_placement, update display to show location, name, etc."""
         self.drawing_all_same_value = False
         if self.cur_placement is not None:
-            self.place.setText(self.table.item(self.cur_placement, self.csv_settings.col_des).text())
+            self.place.setText(self.des_list[self.cur_placement])
 
-            self.pcbpainter.xy_to_draw(float(self.table.item(self.cur_placement, self.csv_settings.col_x).text()),
-                                       float(self.table.item(self.cur_placement, self.csv_settings.col_y).text()),
-                                       not self.isTopLayer(self.cur_placement))
+            x, y = self.position(self.cur_placement)
+            self.pcbpainter.xy_to_draw(x, y, not self.isTopLayer(self.cur_placement))
 
         else:
             if len(self.topDesList) == 0 and len(self.botDesList) == 0:
@@ -923,26 +1247,23 @@ class MeatBagWindow(Widgets.QMainWindow):
 
 
     def scanline_changed(self):
+        # Text is back to what was last looked up (and those matches still stand) with no edit
+        # pending: nothing to wake up for
+        if not self.timerScanLineEdit.isActive() and self.scanLine.toPlainText() == self.last_scan:
+            return
         self.timerScanLineEdit.start(100)
 
     def scanline_changed_dly(self):
-        self.process_new_scan(self.scanLine.toPlainText())
-        self.scanLine.clearFocus()
-
-
-class filterObj(QtCore.QObject):
-    def __init__(self, windowObj):
-        QtCore.QObject.__init__(self)
-        self.windowObj = windowObj
-
-    def eventFilter(self, obj, event):
-        if (event.type() == QtCore.QEvent.KeyPress):
-            key = event.text()
+        scan = self.scanLine.toPlainText()
+        # textChanged also fires for edits that end up with the same text
+        if scan == self.last_scan:
+            return
+        self.process_scanline(scan)
 
-            self.windowObj.key_pressed(key)
-            return True
-        else:
-            return False
+    def process_scanline(self, scan):
+        self.last_scan = scan
+        self.process_new_scan(scan)
+        self.scanLine.clearFocus()
 
 
 def main():
@@ -954,16 +1275,15 @@ def main():
     parser.add_argument('--image')
     args = parser.parse_args()
     csvSettingsAvailable = dict(
-        altium=MeatBagCSVSettingsAltium(),
-        eagle=MeatBagCSVSettingsAltium(),  # same as altium for now
-        kicad=MeatBagCSVSettingsKicadMultiLayer(),
-        default=MeatBagCSVSettingsAltium()
+        altium=MeatBagCSVSettingsAltium,
+        eagle=MeatBagCSVSettingsAltium,  # same as altium for now
+        kicad=MeatBagCSVSettingsKicadMultiLayer,
     )
-    csvSettings = csvSettingsAvailable['default']
-    if args.format and args.format in csvSettingsAvailable:
-        csvSettings = csvSettingsAvailable[args.format]
-    else:
+    csvSettingsClass = csvSettingsAvailable.get(args.format)
+    if csvSettingsClass is None:
         print("Using default CSV format")
+        csvSettingsClass = MeatBagCSVSettingsAltium
+    csvSettings = csvSettingsClass()
     
     app = Widgets.QApplication(sys.argv)
     ex = MeatBagWindow(csvSettings, args)